@@ -1,3 +1,4 @@
+import os
 import shutil
 from pathlib import Path
 
@@ -24,4 +25,20 @@ See https://github.com/pypa/pip/issues/5466. I will remove it now.
     )
     shutil.rmtree(stale_egg_info)
 
-setuptools.setup()
+ext_modules = []
+# Opt-in compiled speedups for pure-Python hot paths. The modules stay importable
+# as plain Python, so the extension is only built when explicitly requested.
+if os.environ.get("BENTOML_ENABLE_SPEEDUPS") == "1":
+    try:
+        from Cython.Build import cythonize
+    except ImportError:
+        raise RuntimeError(
+            "BENTOML_ENABLE_SPEEDUPS=1 requires Cython at build time. Install it with 'pip install cython' and build with 'pip install --no-build-isolation .'"
+        ) from None
+
+    ext_modules = cythonize(
+        ["src/bentoml/_internal/yatai_rest_api_client/schemas.py"],
+        compiler_directives={"language_level": 3, "boundscheck": False},
+    )
+
+setuptools.setup(ext_modules=ext_modules)
@@ -25,6 +25,7 @@ from ..store import Store
 from ..store import StoreItem
 from ..types import PathType
 from ..utils import bentoml_cattr
+from ..utils import safe_load_yaml
 from ..utils import copy_file_to_fs_folder
 from ..models import ModelStore
 from ..runner import Runner
@@ -453,7 +454,7 @@ class BentoInfo:
     @classmethod
     def from_yaml_file(cls, stream: t.IO[t.Any]) -> BentoInfo:
         try:
-            yaml_content = yaml.safe_load(stream)
+            yaml_content = safe_load_yaml(stream)
         except yaml.YAMLError as exc:
             logger.error("Error while parsing YAML file: %s", exc)
             raise
@@ -18,6 +18,7 @@ import fs.copy
 from pathspec import PathSpec
 
 from ..utils import bentoml_cattr
+from ..utils import safe_load_yaml
 from ..utils import resolve_user_filepath
 from ..utils import copy_file_to_fs_folder
 from ..container import generate_containerfile
@@ -809,7 +810,7 @@ class BentoBuildConfig:
     @classmethod
     def from_yaml(cls, stream: t.TextIO) -> BentoBuildConfig:
         try:
-            yaml_content = yaml.safe_load(stream)
+            yaml_content = safe_load_yaml(stream)
         except yaml.YAMLError as exc:
             logger.error(exc)
             raise
@@ -9,13 +9,13 @@ from copy import deepcopy
 from typing import TYPE_CHECKING
 from dataclasses import dataclass
 
-import yaml
 import schema as s
 from simple_di import Provide
 from simple_di import providers
 from deepmerge.merger import Merger
 
 from . import expand_env_var
+from ..utils import safe_load_yaml
 from ..utils import split_with_quotes
 from ..utils import validate_or_create_dir
 from .helpers import flatten_dict
@@ -93,7 +93,7 @@ class BentoMLConfiguration:
                 use_regex=True,
             )
             override_config_map = {
-                k: yaml.safe_load(v)
+                k: safe_load_yaml(v)
                 for k, v in [
                     split_with_quotes(line, sep="=", quote='"')
                     for line in lines
@@ -128,13 +128,15 @@ class BentoMLConfiguration:
         if override_config_file is not None or override_config_values is not None:
             self._finalize()
 
-        if validate_schema:
-            try:
-                spec_module.SCHEMA.validate(self.config)
-            except s.SchemaError as e:
-                raise BentoMLConfigException(
-                    f"Invalid configuration file was given:\n{e}"
-                ) from None
+            # Without overrides self.config is the default configuration, which
+            # get_default_config has already validated.
+            if validate_schema:
+                try:
+                    spec_module.SCHEMA.validate(self.config)
+                except s.SchemaError as e:
+                    raise BentoMLConfigException(
+                        f"Invalid configuration file was given:\n{e}"
+                    ) from None
 
     def _finalize(self):
         RUNNER_CFG_KEYS = ["batching", "resources", "logging", "metrics", "timeout"]
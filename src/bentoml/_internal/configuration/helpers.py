@@ -7,10 +7,10 @@ import logging
 from typing import TYPE_CHECKING
 from functools import singledispatch
 
-import yaml
 import schema as s
 
 from ..utils import LazyLoader
+from ..utils import safe_load_yaml
 from ...exceptions import BentoMLConfigException
 
 if TYPE_CHECKING:
@@ -94,7 +94,7 @@ def load_config_file(path: str) -> dict[str, t.Any]:
             "Configuration file %s not found." % path
         ) from None
     with open(path, "rb") as f:
-        config = yaml.safe_load(f)
+        config = safe_load_yaml(f)
     return config
 
 
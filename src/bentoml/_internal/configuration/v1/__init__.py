@@ -223,7 +223,7 @@ def migration(*, override_config: dict[str, t.Any]):
 
     # 4. if ssl is present, in version 2 we introduce a api_server.ssl.enabled field to determine
     # whether user want to enable SSL.
-    if len([f for f in override_config if f.startswith("api_server.ssl")]) != 0:
+    if any(f.startswith("api_server.ssl") for f in override_config):
         override_config["api_server.ssl.enabled"] = True
 
     # 5. migrate all tracing fields to api_server.tracing
@@ -252,16 +252,7 @@ def migration(*, override_config: dict[str, t.Any]):
         replace_with="tracing.jaeger.thrift.agent_port",
     )
     # we also need to choose which protocol to use for jaeger.
-    if (
-        len(
-            [
-                f
-                for f in override_config
-                if f.startswith("api_server.tracing.jaeger.thrift")
-            ]
-        )
-        != 0
-    ):
+    if any(f.startswith("api_server.tracing.jaeger.thrift") for f in override_config):
         override_config["tracing.jaeger.protocol"] = "thrift"
     # 6. Last but not least, moving logging.formatting.* -> api_server.logging.access.format.*
     for f in ["trace_id", "span_id"]:
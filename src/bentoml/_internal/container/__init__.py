@@ -10,12 +10,12 @@ import contextlib
 from typing import TYPE_CHECKING
 
 import fs
+import attr
 import fs.mirror
 from simple_di import inject
 from simple_di import Provide
 
 from .base import OCIBuilder
-from ..utils import bentoml_cattr
 from .generate import generate_containerfile
 from ...exceptions import InvalidArgument
 from ..configuration.containers import BentoMLContainer
@@ -143,7 +143,6 @@ def construct_containerfile(
     add_header: bool = False,
 ) -> t.Generator[tuple[str, str], None, None]:
     from ..bento.bento import BentoInfo
-    from ..bento.build_config import DockerOptions
 
     dockerfile_path = "env/docker/Dockerfile"
     instruction: list[str] = []
@@ -160,11 +159,8 @@ def construct_containerfile(
         # Dockerfile inside bento, and it is not relevant to
         # construct_containerfile. Hence it is safe to set it to None here.
         # See https://github.com/bentoml/BentoML/issues/3399.
-        docker_attrs = bentoml_cattr.unstructure(options.docker)
-        docker_attrs["dockerfile_template"] = None
-
         dockerfile = generate_containerfile(
-            docker=DockerOptions(**docker_attrs),
+            docker=attr.evolve(options.docker, dockerfile_template=None),
             build_ctx=tempdir,
             conda=options.conda,
             bento_fs=temp_fs,
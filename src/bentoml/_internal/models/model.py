@@ -29,6 +29,7 @@ from ..store import Store
 from ..store import StoreItem
 from ..types import MetadataDict
 from ..utils import bentoml_cattr
+from ..utils import safe_load_yaml
 from ..utils import label_validator
 from ..utils import metadata_validator
 from ...exceptions import NotFound
@@ -635,7 +636,7 @@ class ModelInfo:
     @classmethod
     def from_yaml_file(cls, stream: t.IO[t.Any]) -> ModelInfo:
         try:
-            yaml_content = yaml.safe_load(stream)
+            yaml_content = safe_load_yaml(stream)
         except yaml.YAMLError as exc:  # pragma: no cover - simple error handling
             logger.error(exc)
             raise
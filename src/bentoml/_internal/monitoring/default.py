@@ -8,9 +8,8 @@ import logging.config
 from typing import TYPE_CHECKING
 from pathlib import Path
 
-import yaml
-
 from .api import MonitorBase
+from ..utils import safe_load_yaml
 from ..context import trace_context
 from ..context import component_context
 
@@ -93,7 +92,7 @@ class DefaultMonitor(MonitorBase["JSONSerializable"]):
             monitor_name=self.name,
         )
 
-        logging_config = yaml.safe_load(logging_config_yaml)
+        logging_config = safe_load_yaml(logging_config_yaml)
         logging.config.dictConfig(logging_config)
         self.data_logger = logging.getLogger("bentoml_monitor_data")
         self.schema_logger = logging.getLogger("bentoml_monitor_schema")
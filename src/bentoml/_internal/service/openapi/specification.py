@@ -20,6 +20,7 @@ from cattr.gen import override
 from cattr.gen import make_dict_unstructure_fn
 
 from ...utils import bentoml_cattr
+from ...utils import safe_load_yaml
 
 logger = logging.getLogger(__name__)
 
@@ -283,7 +284,7 @@ class OpenAPISpecification:
     @classmethod
     def from_yaml_file(cls, stream: t.IO[t.Any]) -> OpenAPISpecification:
         try:
-            yaml_content = yaml.safe_load(stream)
+            yaml_content = safe_load_yaml(stream)
         except yaml.YAMLError as exc:
             logger.error(exc)
             raise
@@ -5,6 +5,7 @@ import typing as t
 import datetime
 from abc import ABC
 from abc import abstractmethod
+from operator import attrgetter
 from contextlib import contextmanager
 
 import fs
@@ -114,8 +115,7 @@ class Store(ABC, t.Generic[Item]):
                 f"no {self._item_type.get_typename()}s with name '{tag.name}' exist in BentoML store {self._fs}"
             )
 
-        items.sort(reverse=True, key=lambda item: item.creation_time)
-        tag.version = items[0].tag.version
+        tag.version = max(items, key=attrgetter("creation_time")).tag.version
 
         with self._fs.open(tag.latest_path(), "w") as latest_file:
             latest_file.write(tag.version)
@@ -191,7 +191,8 @@ class Store(ABC, t.Generic[Item]):
                 # if we've removed all versions, remove the directory
                 self._fs.removetree(_tag.name)
             else:
-                new_latest = sorted(versions, key=lambda x: x.creation_time)[-1]
-                # otherwise, update the latest version
+                # otherwise, update the latest version; on creation_time ties the
+                # last listed version wins
+                new_latest = max(reversed(versions), key=attrgetter("creation_time"))
                 assert new_latest.tag.version is not None
                 self._fs.writetext(_tag.latest_path(), new_latest.tag.version)
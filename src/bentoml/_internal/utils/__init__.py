@@ -22,9 +22,15 @@ from datetime import timedelta
 
 import fs
 import attr
+import yaml
 import fs.copy
 from rich.console import Console
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # pragma: no cover
+    from yaml import SafeLoader
+
 if sys.version_info >= (3, 8):
     from functools import cached_property
 else:
@@ -63,11 +69,20 @@ __all__ = [
     "rich_console",
     "experimental",
     "compose",
+    "safe_load_yaml",
 ]
 
 _EXPERIMENTAL_APIS: set[str] = set()
 
 
+def safe_load_yaml(stream: t.Any) -> t.Any:
+    """
+    Same as ``yaml.safe_load``, but uses libyaml's ``CSafeLoader`` when PyYAML was
+    built with it.
+    """
+    return yaml.load(stream, Loader=SafeLoader)
+
+
 def warn_experimental(api_name: str) -> None:
     """
     Warns the user that the given API is experimental.
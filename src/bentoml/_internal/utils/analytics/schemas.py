@@ -18,6 +18,7 @@ from simple_di import inject
 from simple_di import Provide
 
 from ...utils import bentoml_cattr
+from ...utils import safe_load_yaml
 from ...configuration import BENTOML_VERSION
 from ...configuration.containers import BentoMLContainer
 from ...yatai_rest_api_client.config import get_config_path
@@ -59,7 +60,7 @@ def get_client_info(
 
     if os.path.exists(CLIENT_INFO_FILE_PATH):
         with open(CLIENT_INFO_FILE_PATH, "r", encoding="utf-8") as f:
-            client_info = yaml.safe_load(f)
+            client_info = safe_load_yaml(f)
         return bentoml_cattr.structure(client_info, ClientInfo)
     else:
         # Create new client id
@@ -1,4 +1,3 @@
-import os
 import logging
 from typing import List
 from typing import Optional
@@ -6,13 +5,14 @@ from pathlib import Path
 
 import attr
 import yaml
-import cattr
 from simple_di import inject
 from simple_di import Provide
 
 from bentoml.exceptions import YataiRESTApiClientError
 
 from .yatai import YataiRESTApiClient
+from ..utils import safe_load_yaml
+from .schemas import converter
 from ..configuration.containers import BentoMLContainer
 
 logger = logging.getLogger(__name__)
@@ -67,7 +67,7 @@ _config: YataiClientConfig = YataiClientConfig()
 
 def store_config(config: YataiClientConfig) -> None:
     with open(get_config_path(), "w") as f:
-        dct = cattr.unstructure(config)
+        dct = converter.unstructure(config)
         yaml.dump(dct, stream=f)
 
 
@@ -78,13 +78,14 @@ def init_config() -> YataiClientConfig:
 
 
 def get_config() -> YataiClientConfig:
-    if not os.path.exists(get_config_path()):
+    try:
+        with open(get_config_path(), "r") as f:
+            dct = safe_load_yaml(f)
+    except FileNotFoundError:
         return init_config()
-    with open(get_config_path(), "r") as f:
-        dct = yaml.safe_load(f)
-        if not dct:
-            return init_config()
-        return cattr.structure(dct, YataiClientConfig)
+    if not dct:
+        return init_config()
+    return converter.structure(dct, YataiClientConfig)
 
 
 def add_context(context: YataiClientContext, *, ignore_warning: bool = False) -> None:
@@ -3,27 +3,48 @@ import typing as t
 from enum import Enum
 from typing import TYPE_CHECKING
 from datetime import datetime
+from operator import attrgetter
 
 import attr
 import cattr
 from dateutil.parser import parse
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore (optional accelerator)
+
 time_format = "%Y-%m-%d %H:%M:%S.%f"
 
 
 def datetime_encoder(time_obj: t.Optional[datetime]) -> t.Optional[str]:
     if not time_obj:
         return None
-    return time_obj.strftime(time_format)
+    # Keep the wire format of strftime(time_format), which ignores tzinfo.
+    if time_obj.tzinfo is not None:
+        time_obj = time_obj.replace(tzinfo=None)
+    return time_obj.isoformat(sep=" ", timespec="microseconds")
 
 
 def datetime_decoder(datetime_str: t.Optional[str], _: t.Any) -> t.Optional[datetime]:
     if not datetime_str:
         return None
-    return parse(datetime_str)
-
-
-converter = cattr.Converter()
+    # Yatai and datetime_encoder emit fixed formats, so try the cheap parsers
+    # first and only let dateutil sniff the format as a last resort.
+    if datetime_str.endswith("Z"):
+        # datetime.fromisoformat only accepts a trailing "Z" on Python 3.11+
+        datetime_str = datetime_str[:-1] + "+00:00"
+    try:
+        return datetime.fromisoformat(datetime_str)
+    except ValueError:
+        pass
+    try:
+        return datetime.strptime(datetime_str, time_format)
+    except ValueError:
+        return parse(datetime_str)
+
+
+converter = cattr.GenConverter()
 
 converter.register_unstructure_hook(datetime, datetime_encoder)
 converter.register_structure_hook(datetime, datetime_decoder)
@@ -33,12 +54,17 @@ T = t.TypeVar("T")
 
 
 def schema_from_json(json_content: str, cls: t.Type[T]) -> T:
-    dct = json.loads(json_content)
+    if orjson is not None:
+        dct = orjson.loads(json_content)
+    else:
+        dct = json.loads(json_content)
     return converter.structure(dct, cls)
 
 
 def schema_to_json(obj: t.Any) -> str:
     res = converter.unstructure(obj, obj.__class__)
+    # Request bodies are sent as str, which http.client encodes as latin-1, so
+    # keep json.dumps' ASCII escaping rather than orjson's raw UTF-8 output.
     return json.dumps(res)
 
 
@@ -73,7 +99,7 @@ class ResourceSchema(BaseSchema):
     resource_type: ResourceType
 
 
-@attr.define
+@attr.frozen
 class LabelItemSchema:
     key: str
     value: str
@@ -127,7 +153,7 @@ class BentoUploadStatus(Enum):
     FAILED = "failed"
 
 
-@attr.define
+@attr.frozen
 class BentoApiSchema:
     route: str
     doc: str
@@ -212,7 +238,7 @@ class PreSignMultipartUploadUrlSchema:
     part_number: int
 
 
-@attr.define
+@attr.frozen
 class CompletePartSchema:
     part_number: int
     etag: str
@@ -299,3 +325,29 @@ class CreateModelSchema:
 class FinishUploadModelSchema:
     status: t.Optional[ModelUploadStatus]
     reason: t.Optional[str]
+
+
+def _make_enum_structure_fn(cls: t.Type[Enum]) -> t.Callable[[t.Any, t.Any], Enum]:
+    value2member = cls._value2member_map_
+
+    def structure(value: t.Any, _: t.Any) -> Enum:
+        try:
+            return value2member[value]
+        except (KeyError, TypeError):
+            # let the Enum raise its usual "... is not a valid ..." ValueError
+            return cls(value)
+
+    return structure
+
+
+def _register_enum_hooks() -> None:
+    # cattrs generates the attrs (un)structure functions lazily on first use, and
+    # those capture the hooks of their field types, so the Enum hooks have to be
+    # registered before any schema is converted.
+    for obj in list(globals().values()):
+        if isinstance(obj, type) and issubclass(obj, Enum) and obj is not Enum:
+            converter.register_structure_hook(obj, _make_enum_structure_fn(obj))
+            converter.register_unstructure_hook(obj, attrgetter("value"))
+
+
+_register_enum_hooks()
@@ -75,18 +75,24 @@ class Client(ABC):
     def wait_until_server_is_ready(host: str, port: int, timeout: int) -> None:
         import time
 
-        time_end = time.time() + timeout
-        status = None
-        while status != 200:
+        time_end = time.monotonic() + timeout
+        next_notice = time.monotonic()
+        delay = 0.1
+        while True:
             try:
                 conn = HTTPConnection(host, port)
                 conn.request("GET", "/readyz")
-                status = conn.getresponse().status
+                if conn.getresponse().status == 200:
+                    return
             except ConnectionRefusedError:
-                print("Connection refused. Trying again...")
-            if time.time() > time_end:
+                # probes can be sub-second apart, report refusals at most once a second
+                if time.monotonic() >= next_notice:
+                    print("Connection refused. Trying again...")
+                    next_notice = time.monotonic() + 1
+            if time.monotonic() > time_end:
                 raise TimeoutError("The server took too long to get ready")
-            time.sleep(1)
+            time.sleep(delay)
+            delay = min(delay * 1.5, 1.0)
 
     def __enter__(self):
         return self
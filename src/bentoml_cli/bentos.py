@@ -4,6 +4,7 @@ import sys
 import json
 import typing as t
 from typing import TYPE_CHECKING
+from operator import itemgetter
 
 import yaml
 import click
@@ -45,7 +46,6 @@ def add_bento_management_commands(cli: Group):
     from bentoml._internal.utils import human_readable_size
     from bentoml._internal.utils import display_path_under_home
     from bentoml._internal.bento.bento import DEFAULT_BENTO_BUILD_FILE
-    from bentoml._internal.yatai_client import yatai_client
     from bentoml._internal.configuration.containers import BentoMLContainer
 
     bento_store = BentoMLContainer.bento_store.get()
@@ -70,8 +70,7 @@ def add_bento_management_commands(cli: Group):
         if output == "path":
             console.print(bento.path)
         elif output == "json":
-            info = json.dumps(bento.info.to_dict(), indent=2, default=str)
-            console.print_json(info)
+            console.print_json(data=bento.info.to_dict(), default=str)
         else:
             info = yaml.dump(bento.info, indent=2, sort_keys=False)
             console.print(Syntax(info, "yaml"))
@@ -96,40 +95,39 @@ def add_bento_management_commands(cli: Group):
         $ bentoml list FraudDetector
         """
         bentos = bento_store.list(bento_name)
-        res = [
-            {
-                "tag": str(bento.tag),
-                "path": display_path_under_home(bento.path),
-                "size": human_readable_size(calc_dir_size(bento.path)),
-                "creation_time": bento.info.creation_time.astimezone().strftime(
-                    "%Y-%m-%d %H:%M:%S"
-                ),
-            }
-            for bento in sorted(
-                bentos, key=lambda x: x.info.creation_time, reverse=True
+        keyed = [(bento.info.creation_time, bento) for bento in bentos]
+        keyed.sort(key=itemgetter(0), reverse=True)
+        # Rows are in table column order: tag, size, creation time, path.
+        rows = (
+            (
+                str(bento.tag),
+                human_readable_size(calc_dir_size(bento.path)),
+                creation_time.astimezone().isoformat(sep=" ", timespec="seconds")[:19],
+                display_path_under_home(bento.path),
             )
-        ]
+            for creation_time, bento in keyed
+        )
 
-        if output == "json":
-            info = json.dumps(res, indent=2)
-            console.print(info)
-        elif output == "yaml":
-            info = yaml.safe_dump(res, indent=2)
-            console.print(Syntax(info, "yaml"))
-        else:
+        if output == "table":
             table = Table(box=None)
             table.add_column("Tag")
             table.add_column("Size")
-            table.add_column("Creation Time")
+            table.add_column("Creation Time", no_wrap=True, width=19)
             table.add_column("Path")
-            for bento in res:
-                table.add_row(
-                    bento["tag"],
-                    bento["size"],
-                    bento["creation_time"],
-                    bento["path"],
-                )
+            for row in rows:
+                table.add_row(*row)
             console.print(table)
+        else:
+            res = [
+                {"tag": tag, "path": path, "size": size, "creation_time": creation_time}
+                for tag, size, creation_time, path in rows
+            ]
+            if output == "json":
+                info = json.dumps(res, indent=2)
+                console.print(info)
+            else:
+                info = yaml.safe_dump(res, indent=2)
+                console.print(Syntax(info, "yaml"))
 
     @cli.command()
     @click.argument(
@@ -235,6 +233,8 @@ def add_bento_management_commands(cli: Group):
     )
     def pull(bento_tag: str, force: bool) -> None:  # type: ignore (not accessed)
         """Pull Bento from a yatai server."""
+        from bentoml._internal.yatai_client import yatai_client
+
         yatai_client.pull_bento(bento_tag, force=force)
 
     @cli.command()
@@ -254,6 +254,8 @@ def add_bento_management_commands(cli: Group):
     )
     def push(bento_tag: str, force: bool, threads: int) -> None:  # type: ignore (not accessed)
         """Push Bento to a yatai server."""
+        from bentoml._internal.yatai_client import yatai_client
+
         bento_obj = bento_store.get(bento_tag)
         if not bento_obj:
             raise click.ClickException(f"Bento {bento_tag} not found in local store")
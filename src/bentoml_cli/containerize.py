@@ -48,6 +48,8 @@ def normalize_none_type(
 
 # NOTE: This is the key we use to store the transformed options in the CLI context.
 _MEMO_KEY = "_memoized"
+# Separator between ARG and VALUE for options handled by opt_callback.
+_OPT_SEPARATOR = re.compile(r"=|:")
 
 
 def compatible_option(*param_decls: str, **attrs: t.Any):
@@ -382,21 +384,21 @@ def opt_callback(ctx: Context, param: Parameter, value: ClickParamType):
         # our memoized options are stored as a dict.
         ctx.params[_MEMO_KEY] = {}
 
-    if param.name not in ctx.params[_MEMO_KEY]:
-        ctx.params[_MEMO_KEY][param.name] = ()
+    memoized = ctx.params[_MEMO_KEY]
+    if param.name not in memoized:
+        memoized[param.name] = ()
 
     value = normalize_none_type(value)
     if value is not None and isinstance(value, tuple):
         for opt in value:
-            o, *val = re.split(r"=|:", opt, maxsplit=1)
+            o, *val = _OPT_SEPARATOR.split(opt, maxsplit=1)
             norm = o.replace("-", "_")
             if len(val) == 0:
                 # --opt bool
-                ctx.params[_MEMO_KEY][norm] = True
+                memoized[norm] = True
             else:
                 # --opt key=value
-                ctx.params[_MEMO_KEY].setdefault(norm, ())
-                ctx.params[_MEMO_KEY][norm] += (*val,)
+                memoized[norm] = memoized.get(norm, ()) + (*val,)
     return value
 
 
@@ -1,9 +1,9 @@
 from __future__ import annotations
 
-import json
 import typing as t
 import logging
 from typing import TYPE_CHECKING
+from operator import itemgetter
 
 import yaml
 import click
@@ -43,7 +43,6 @@ def add_model_management_commands(cli: Group) -> None:
     from bentoml._internal.utils import rich_console as console
     from bentoml._internal.utils import calc_dir_size
     from bentoml._internal.utils import human_readable_size
-    from bentoml._internal.yatai_client import yatai_client
     from bentoml._internal.configuration.containers import BentoMLContainer
 
     model_store = BentoMLContainer.model_store.get()
@@ -72,8 +71,7 @@ def add_model_management_commands(cli: Group) -> None:
         if output == "path":
             console.print(model.path)
         elif output == "json":
-            info = json.dumps(model.info.to_dict(), indent=2, default=str)
-            console.print_json(info)
+            console.print_json(data=model.info.to_dict(), default=str)
         else:
             console.print(Syntax(str(model.info.dump()), "yaml"))
 
@@ -98,39 +96,42 @@ def add_model_management_commands(cli: Group) -> None:
         """
 
         models = model_store.list(model_name)
-        res = [
-            {
-                "tag": str(model.tag),
-                "module": model.info.module,
-                "size": human_readable_size(calc_dir_size(model.path)),
-                "creation_time": model.info.creation_time.astimezone().strftime(
-                    "%Y-%m-%d %H:%M:%S"
-                ),
-            }
-            for model in sorted(
-                models, key=lambda x: x.info.creation_time, reverse=True
+        keyed = [(model.info.creation_time, model) for model in models]
+        keyed.sort(key=itemgetter(0), reverse=True)
+        # Rows are in table column order: tag, module, size, creation time.
+        rows = (
+            (
+                str(model.tag),
+                model.info.module,
+                human_readable_size(calc_dir_size(model.path)),
+                creation_time.astimezone().isoformat(sep=" ", timespec="seconds")[:19],
             )
-        ]
-        if output == "json":
-            info = json.dumps(res, indent=2)
-            console.print_json(info)
-        elif output == "yaml":
-            info = yaml.safe_dump(res, indent=2)
-            console.print(Syntax(info, "yaml"))
-        else:
+            for creation_time, model in keyed
+        )
+        if output == "table":
             table = Table(box=None)
             table.add_column("Tag")
             table.add_column("Module")
             table.add_column("Size")
-            table.add_column("Creation Time")
-            for model in res:
-                table.add_row(
-                    model["tag"],
-                    model["module"],
-                    model["size"],
-                    model["creation_time"],
-                )
+            table.add_column("Creation Time", no_wrap=True, width=19)
+            for row in rows:
+                table.add_row(*row)
             console.print(table)
+        else:
+            res = [
+                {
+                    "tag": tag,
+                    "module": module,
+                    "size": size,
+                    "creation_time": creation_time,
+                }
+                for tag, module, size, creation_time in rows
+            ]
+            if output == "json":
+                console.print_json(data=res)
+            else:
+                info = yaml.safe_dump(res, indent=2)
+                console.print(Syntax(info, "yaml"))
 
     @model_cli.command()
     @click.argument(
@@ -226,6 +227,8 @@ def add_model_management_commands(cli: Group) -> None:
     )
     def pull(model_tag: str, force: bool):  # type: ignore (not accessed)
         """Pull Model from a yatai server."""
+        from bentoml._internal.yatai_client import yatai_client
+
         yatai_client.pull_model(model_tag, force=force)
 
     @model_cli.command()
@@ -245,6 +248,8 @@ def add_model_management_commands(cli: Group) -> None:
     )
     def push(model_tag: str, force: bool, threads: int):  # type: ignore (not accessed)
         """Push Model to a yatai server."""
+        from bentoml._internal.yatai_client import yatai_client
+
         model_obj = model_store.get(model_tag)
         if not model_obj:
             raise click.ClickException(f"Model {model_tag} not found in local store")
@@ -3,6 +3,7 @@ from __future__ import annotations
 import os
 import sys
 import json
+import typing as t
 import logging
 from urllib.parse import urlparse
 
@@ -11,6 +12,19 @@ import click
 logger = logging.getLogger(__name__)
 
 
+def parse_remote_runner(remote_runner: t.Iterable[str] | None) -> dict[str, str]:
+    runner_map: dict[str, str] = {}
+    for item in remote_runner or []:
+        name, sep, address = item.partition("=")
+        if not sep:
+            raise click.BadParameter(
+                f'Bad formatting: "{item}". Expected "runner_name=address".',
+                param_hint="--remote-runner",
+            )
+        runner_map[name] = address
+    return runner_map
+
+
 def add_start_command(cli: click.Group) -> None:
 
     from bentoml.grpc.utils import LATEST_PROTOCOL_VERSION
@@ -151,9 +165,7 @@ def add_start_command(cli: click.Group) -> None:
         from bentoml.start import start_http_server
 
         if remote_runner:
-            runner_map_dict = dict(
-                [s.split("=", maxsplit=2) for s in remote_runner or []]
-            )
+            runner_map_dict = parse_remote_runner(remote_runner)
         elif runner_map:
             runner_map_dict = json.loads(runner_map)
         else:
@@ -387,7 +399,7 @@ def add_start_command(cli: click.Group) -> None:
 
         from bentoml.start import start_grpc_server
 
-        runner_map = dict([s.split("=", maxsplit=2) for s in remote_runner or []])
+        runner_map = parse_remote_runner(remote_runner)
         click.echo(f"Using remote runners: {runner_map}")
         start_grpc_server(
             bento,
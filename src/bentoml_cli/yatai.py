@@ -6,10 +6,6 @@ import click
 def add_login_command(cli: click.Group) -> None:
     from bentoml_cli.utils import BentoMLCommandGroup
     from bentoml.exceptions import CLIException
-    from bentoml._internal.yatai_rest_api_client.yatai import YataiRESTApiClient
-    from bentoml._internal.yatai_rest_api_client.config import add_context
-    from bentoml._internal.yatai_rest_api_client.config import YataiClientContext
-    from bentoml._internal.yatai_rest_api_client.config import default_context_name
 
     @cli.group(name="yatai", cls=BentoMLCommandGroup)
     def yatai_cli():
@@ -22,6 +18,11 @@ def add_login_command(cli: click.Group) -> None:
     @click.option("--api-token", type=click.STRING, help="Yatai user API token")
     def login(endpoint: str, api_token: str) -> None:  # type: ignore (not accessed)
         """Login to Yatai server."""
+        from bentoml._internal.yatai_rest_api_client.yatai import YataiRESTApiClient
+        from bentoml._internal.yatai_rest_api_client.config import add_context
+        from bentoml._internal.yatai_rest_api_client.config import YataiClientContext
+        from bentoml._internal.yatai_rest_api_client.config import default_context_name
+
         if not endpoint:
             raise CLIException("need --endpoint")
 
@@ -2,6 +2,7 @@ from datetime import date
 from datetime import datetime
 from datetime import timedelta
 
+import yaml
 import numpy as np
 import pandas as pd
 import pytest
@@ -126,3 +127,10 @@ def test_validate_metadata():
     inp = {"unsupported": None}  # type: ignore (testing bad types)
     with pytest.raises(ValueError):
         utils.validate_metadata(inp)
+
+
+def test_safe_load_yaml():
+    assert utils.safe_load_yaml("a: 1\nb: [x, y]\n") == {"a": 1, "b": ["x", "y"]}
+    assert utils.safe_load_yaml("") is None
+    with pytest.raises(yaml.constructor.ConstructorError):
+        utils.safe_load_yaml("!!python/object:os.system {}")
@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import json
+from datetime import datetime
+from datetime import timezone
+
+import pytest
+from cattrs.errors import ClassValidationError
+
+from bentoml._internal.yatai_rest_api_client.schemas import time_format
+from bentoml._internal.yatai_rest_api_client.schemas import BentoApiSchema
+from bentoml._internal.yatai_rest_api_client.schemas import schema_to_json
+from bentoml._internal.yatai_rest_api_client.schemas import LabelItemSchema
+from bentoml._internal.yatai_rest_api_client.schemas import datetime_decoder
+from bentoml._internal.yatai_rest_api_client.schemas import datetime_encoder
+from bentoml._internal.yatai_rest_api_client.schemas import schema_from_json
+from bentoml._internal.yatai_rest_api_client.schemas import BentoUploadStatus
+from bentoml._internal.yatai_rest_api_client.schemas import CreateBentoSchema
+from bentoml._internal.yatai_rest_api_client.schemas import BentoManifestSchema
+from bentoml._internal.yatai_rest_api_client.schemas import FinishUploadBentoSchema
+
+
+@pytest.mark.parametrize(
+    "datetime_str,expected",
+    [
+        ("2022-11-01 12:30:45.123456", datetime(2022, 11, 1, 12, 30, 45, 123456)),
+        ("2022-11-01T12:30:45", datetime(2022, 11, 1, 12, 30, 45)),
+        (
+            "2022-11-01T12:30:45.123456+00:00",
+            datetime(2022, 11, 1, 12, 30, 45, 123456, tzinfo=timezone.utc),
+        ),
+        (
+            "2022-11-01T12:30:45.123456789Z",
+            datetime(2022, 11, 1, 12, 30, 45, 123456, tzinfo=timezone.utc),
+        ),
+    ],
+)
+def test_datetime_decoder(datetime_str: str, expected: datetime):
+    assert datetime_decoder(datetime_str, datetime) == expected
+
+
+def test_datetime_decoder_empty():
+    assert datetime_decoder(None, datetime) is None
+    assert datetime_decoder("", datetime) is None
+
+
+@pytest.mark.parametrize(
+    "time_obj",
+    [
+        datetime(2022, 11, 1, 12, 30, 45),
+        datetime(2022, 11, 1, 12, 30, 45, 123456, tzinfo=timezone.utc),
+    ],
+)
+def test_datetime_encoder(time_obj: datetime):
+    assert datetime_encoder(time_obj) == time_obj.strftime(time_format)
+
+
+def test_datetime_roundtrip():
+    now = datetime.now()
+    assert datetime_decoder(datetime_encoder(now), datetime) == now
+
+
+def test_schema_json_roundtrip():
+    req = CreateBentoSchema(
+        description="test",
+        version="v1",
+        manifest=BentoManifestSchema(
+            service="svc:Service",
+            bentoml_version="1.0.0",
+            size_bytes=1024,
+            apis={"predict": BentoApiSchema("predict", "", "JSON", "JSON")},
+            models=["iris_clf:v1"],
+        ),
+        labels=[LabelItemSchema("owner", "bentoml")],
+    )
+    assert schema_from_json(schema_to_json(req), CreateBentoSchema) == req
+
+
+def test_schema_to_json_non_ascii():
+    req = CreateBentoSchema(
+        description="模型 ✓",
+        version="v1",
+        manifest=BentoManifestSchema(
+            service="svc:Service",
+            bentoml_version="1.0.0",
+            size_bytes=1024,
+            apis={},
+            models=[],
+        ),
+        labels=[LabelItemSchema("owner", "ünïcode")],
+    )
+    content = schema_to_json(req)
+    # request bodies are sent as str, which http.client encodes as latin-1
+    content.encode("latin-1")
+    assert schema_from_json(content, CreateBentoSchema) == req
+
+
+def test_schema_enum_roundtrip():
+    req = FinishUploadBentoSchema(status=BentoUploadStatus.SUCCESS, reason=None)
+    assert json.loads(schema_to_json(req)) == {"status": "success", "reason": None}
+    assert schema_from_json(schema_to_json(req), FinishUploadBentoSchema) == req
+
+
+def test_schema_enum_unknown_value():
+    with pytest.raises(ClassValidationError) as excinfo:
+        schema_from_json('{"status": "bogus", "reason": null}', FinishUploadBentoSchema)
+    (err,) = excinfo.value.exceptions
+    assert isinstance(err, ValueError)
+    assert str(err) == "'bogus' is not a valid BentoUploadStatus"
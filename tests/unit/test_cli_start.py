@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+import click
+import pytest
+
+from bentoml_cli.start import parse_remote_runner
+
+
+@pytest.mark.parametrize(
+    "remote_runner,expected",
+    [
+        (None, {}),
+        ([], {}),
+        (["iris_clf=http://127.0.0.1:3001"], {"iris_clf": "http://127.0.0.1:3001"}),
+        (["a=b", "c=d"], {"a": "b", "c": "d"}),
+        # only the first "=" separates the runner name from its address
+        (["a=b=c"], {"a": "b=c"}),
+    ],
+)
+def test_parse_remote_runner(remote_runner: list[str] | None, expected: dict[str, str]):
+    assert parse_remote_runner(remote_runner) == expected
+
+
+def test_parse_remote_runner_missing_separator():
+    with pytest.raises(click.BadParameter, match='Bad formatting: "iris_clf"'):
+        parse_remote_runner(["iris_clf"])
@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import time
+import typing as t
+
+import pytest
+
+import bentoml.client
+from bentoml.client import Client
+
+if t.TYPE_CHECKING:
+    from _pytest.capture import CaptureFixture
+    from _pytest.monkeypatch import MonkeyPatch
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.sleeps: list[float] = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def patch_server(
+    monkeypatch: MonkeyPatch, clock: FakeClock, ready_at: float | None
+) -> None:
+    class FakeResponse:
+        status = 200
+
+    class FakeConnection:
+        def __init__(self, host: str, port: int) -> None:
+            pass
+
+        def request(self, method: str, url: str) -> None:
+            assert (method, url) == ("GET", "/readyz")
+            if ready_at is None or clock.now < ready_at:
+                raise ConnectionRefusedError
+
+        def getresponse(self) -> FakeResponse:
+            return FakeResponse()
+
+    monkeypatch.setattr(bentoml.client, "HTTPConnection", FakeConnection)
+    monkeypatch.setattr(time, "monotonic", clock.monotonic)
+    monkeypatch.setattr(time, "sleep", clock.sleep)
+
+
+def test_wait_until_server_is_ready_returns_on_ready(monkeypatch: MonkeyPatch):
+    clock = FakeClock()
+    patch_server(monkeypatch, clock, ready_at=0)
+    Client.wait_until_server_is_ready("localhost", 3000, timeout=10)
+    assert clock.sleeps == []
+
+
+def test_wait_until_server_is_ready_backoff(
+    monkeypatch: MonkeyPatch, capsys: CaptureFixture[str]
+):
+    clock = FakeClock()
+    patch_server(monkeypatch, clock, ready_at=2.5)
+    Client.wait_until_server_is_ready("localhost", 3000, timeout=10)
+    assert clock.sleeps[0] == pytest.approx(0.1)
+    assert max(clock.sleeps) <= 1.0
+    assert clock.now < 3.5
+    # 7 refused probes in ~2s, reported at most once per second
+    assert capsys.readouterr().out.count("Connection refused") == 2
+
+
+def test_wait_until_server_is_ready_timeout(monkeypatch: MonkeyPatch):
+    clock = FakeClock()
+    patch_server(monkeypatch, clock, ready_at=None)
+    with pytest.raises(TimeoutError):
+        Client.wait_until_server_is_ready("localhost", 3000, timeout=5)
+    assert 5 < clock.now <= 6